@@ -0,0 +1,170 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""Vectorized counterparts of the core functions.
+Each function of this registry takes a (N, d) matrix of N points of dimension d,
+and returns the (N,) vector of values of the core function with the same name.
+"""
+
+from typing import Callable
+import numpy as np
+from . import corefuncs
+from ..common.decorators import Registry
+
+
+registry = Registry[Callable[[np.ndarray], np.ndarray]]()
+
+
+def batch_call(name: str, X: np.ndarray) -> np.ndarray:
+    """Evaluates the core function with the provided name on each row of X.
+    The vectorized implementation is used if it exists, otherwise it falls back
+    to calling the core function on each row.
+
+    Parameters
+    ----------
+    name: str
+        name of the function in the core function registry
+    X: np.ndarray
+        (N, d) matrix of N points of dimension d
+
+    Returns
+    -------
+    np.ndarray
+        the (N,) vector of function values
+    """
+    X = np.ascontiguousarray(X)
+    if name in registry:
+        return registry[name](X)
+    func = corefuncs.registry[name]
+    return np.array([func(x) for x in X])
+
+
+@registry.register
+def sphere(X: np.ndarray) -> np.ndarray:
+    assert X.ndim == 2
+    return np.einsum("ij,ij->i", X, X)
+
+
+@registry.register
+def sphere1(X: np.ndarray) -> np.ndarray:
+    return sphere(X - 1.0)
+
+
+@registry.register
+def sphere2(X: np.ndarray) -> np.ndarray:
+    return sphere(X - 2.0)
+
+
+@registry.register
+def sphere4(X: np.ndarray) -> np.ndarray:
+    return sphere(X - 4.0)
+
+
+@registry.register
+def maxdeceptive(X: np.ndarray) -> np.ndarray:
+    return np.max(corefuncs._deceptive_terms(X), axis=1)
+
+
+@registry.register
+def sumdeceptive(X: np.ndarray) -> np.ndarray:
+    return np.sum(corefuncs._deceptive_terms(X), axis=1)
+
+
+@registry.register
+def altcigar(X: np.ndarray) -> np.ndarray:
+    return X[:, -1] ** 2 + 1000000.0 * sphere(X[:, :-1])
+
+
+@registry.register
+def cigar(X: np.ndarray) -> np.ndarray:
+    return X[:, 0] ** 2 + 1000000.0 * sphere(X[:, 1:])
+
+
+@registry.register
+def altellipsoid(X: np.ndarray) -> np.ndarray:
+    weights = corefuncs._ellipsoid_weights(X.shape[1], reverse=True, dtype=X.dtype)
+    return (X * X).dot(weights)
+
+
+@registry.register
+def ellipsoid(X: np.ndarray) -> np.ndarray:
+    weights = corefuncs._ellipsoid_weights(X.shape[1], dtype=X.dtype)
+    return (X * X).dot(weights)
+
+
+@registry.register
+def rastrigin(X: np.ndarray) -> np.ndarray:
+    cosi = np.sum(np.cos(corefuncs._TWO_PI * X), axis=1)
+    return 10 * (X.shape[1] - cosi) + sphere(X)
+
+
+@registry.register
+def hm(X: np.ndarray) -> np.ndarray:
+    return np.einsum("ij,ij->i", X ** 2, 1.1 + np.cos(1.0 / X))
+
+
+@registry.register
+def rosenbrock(X: np.ndarray) -> np.ndarray:
+    x_m_1 = X[:, :-1] - 1
+    x_diff = np.square(X[:, :-1])
+    x_diff -= X[:, 1:]
+    return 100 * sphere(x_diff) + sphere(x_m_1)
+
+
+@registry.register
+def griewank(X: np.ndarray) -> np.ndarray:
+    part1 = sphere(X)
+    part2 = np.prod(np.cos(X * corefuncs._griewank_scales(X.shape[1])), axis=1)
+    return 1 + part1 / 4000.0 - part2
+
+
+@registry.register
+def lunacek(X: np.ndarray) -> np.ndarray:
+    problemDimensions = X.shape[1]
+    s = 1.0 - (1.0 / (2.0 * np.sqrt(problemDimensions + 20.0) - 8.2))
+    mu1 = 2.5
+    mu2 = -np.sqrt(abs((mu1 ** 2 - 1.0) / s))
+    firstSum = sphere(X - mu1)
+    secondSum = sphere(X - mu2)
+    thirdSum = np.sum(1.0 - np.cos(corefuncs._TWO_PI * (X - mu1)), axis=1)
+    return np.minimum(firstSum, 1.0 * problemDimensions + secondSum) + 10 * thirdSum
+
+
+@registry.register
+def genzcornerpeak(X: np.ndarray) -> np.ndarray:
+    value = 1 + np.mean(np.tanh(X), axis=1)
+    with np.errstate(divide="ignore"):
+        return value ** (-X.shape[1] - 1)
+
+
+@registry.register
+def minusgenzcornerpeak(X: np.ndarray) -> np.ndarray:
+    return -genzcornerpeak(X)
+
+
+@registry.register
+def genzgaussianpeakintegral(X: np.ndarray) -> np.ndarray:
+    return np.exp(-sphere(X) / 4.0)
+
+
+@registry.register
+def minusgenzgaussianpeakintegral(X: np.ndarray) -> np.ndarray:
+    return -genzgaussianpeakintegral(X)
+
+
+@registry.register
+def slope(X: np.ndarray) -> np.ndarray:
+    return np.sum(X, axis=1)
+
+
+@registry.register
+def linear(X: np.ndarray) -> np.ndarray:
+    return np.tanh(X[:, 0])
+
+
+@registry.register
+def st0(X: np.ndarray) -> np.ndarray:
+    X2 = X * X
+    return 39.16599 * X.shape[1] + 0.5 * np.sum((X2 - 16) * X2 + 5 * X, axis=1)
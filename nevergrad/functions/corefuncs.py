@@ -3,18 +3,27 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Dict, Any, Tuple, List, Callable
-from math import exp, sqrt, tanh
+from typing import Dict, Any, Tuple, List, Union, Callable
+from math import atan, cos, exp, pi, sqrt, tanh
 import numpy as np
 from .utils import PostponedObject
 from ..instrumentation import discretization
 from ..common.decorators import Registry
 
 
+# Note: sphere, ellipsoid, rastrigin, ackley and rosenbrock perform their computation in single
+# precision when provided with float32 arrays, which is faster if a lower accuracy is acceptable.
 registry = Registry[Callable[[np.ndarray], float]]()
+_TWO_PI = 2 * pi
 
 
-def _onemax(x: List[int]) -> float:
+def _count_ones(x: Union[List[int], np.ndarray]) -> int:
+    """Number of values which round to 1.
+    """
+    return int(np.count_nonzero(np.rint(x) == 1))
+
+
+def _onemax(x: Union[List[int], np.ndarray]) -> float:
     """onemax(x) is the most classical case of discrete functions, adapted to minimization.
 
     It is originally designed for lists of bits. It just counts the number of 1,
@@ -22,10 +31,10 @@ def _onemax(x: List[int]) -> float:
     It also works in the continuous case but in that cases discretizes the
     input domain by ]0.5,1.5] --> 1 and 0 everywhere else.
     """
-    return len(x) - sum(1 if int(round(w)) == 1 else 0 for w in x)
+    return len(x) - _count_ones(x)
 
 
-def _leadingones(x: List[int]) -> float:
+def _leadingones(x: Union[List[int], np.ndarray]) -> float:
     """leadingones is the second most classical discrete function, adapted for minimization.
 
     Returns len(x) - number of initial 1. I.e.
@@ -33,13 +42,19 @@ def _leadingones(x: List[int]) -> float:
     leadingones([1 1 1 1]) = 0,
     leadingones([1 0 0 0]) = 1.
     """
-    for i, x_ in enumerate(list(x)):
-        if int(round(x_)) != 1:
-            return len(x) - i
-    return 0
-
-
-def _jump(x: List[int]) -> float:  # TODO: docstring?
+    if isinstance(x, list):  # early exit is faster than numpy dispatch on lists
+        for i, x_ in enumerate(x):
+            if int(round(x_)) != 1:
+                return len(x) - i
+        return 0
+    not_ones = np.rint(x) != 1
+    if not not_ones.size:
+        return 0
+    idx = int(not_ones.argmax())
+    return len(x) - idx if not_ones[idx] else 0
+
+
+def _jump(x: Union[List[int], np.ndarray]) -> float:  # TODO: docstring?
     """There exists variants of jump functions; we are in minimization.
 
     The principle of a jump function is that local descent does not succeed.
@@ -47,7 +62,7 @@ def _jump(x: List[int]) -> float:  # TODO: docstring?
     """
     n = len(x)
     m = n // 4
-    o = n - _onemax(x)
+    o = _count_ones(x)
     if o == n or o <= n - m:
         return n - m - o
     return o  # Deceptive part.
@@ -55,10 +70,10 @@ def _jump(x: List[int]) -> float:  # TODO: docstring?
 
 def _styblinksitang(x: np.ndarray, noise: float) -> float:
     """Classical function for testing noisy optimization."""
-    x2 = x ** 2
-    val = x2.dot(x2) + np.sum(5 * x - 16 * x2)
+    x2 = x * x
+    val = float(np.sum((x2 - 16) * x2 + 5 * x))
     # return a positive value for maximization
-    return float(39.16599 * len(x) + 0.5 * val + noise * np.random.normal(size=val.shape))
+    return 39.16599 * len(x) + 0.5 * val + (noise * np.random.normal() if noise else 0.0)
 
 
 class DelayedSphere(PostponedObject):
@@ -82,34 +97,52 @@ def sphere(x: np.ndarray) -> float:
     return float(x.dot(x))
 
 
+def _shifted_sphere(x: np.ndarray, shift: float) -> float:
+    y = x - shift
+    return float(y.dot(y))
+
+
 @registry.register
 def sphere1(x: np.ndarray) -> float:
     """Translated sphere function."""
-    return sphere(x - 1.0)
+    return _shifted_sphere(x, 1.0)
 
 
 @registry.register
 def sphere2(x: np.ndarray) -> float:
     """A bit more translated sphere function."""
-    return sphere(x - 2.0)
+    return _shifted_sphere(x, 2.0)
 
 
 @registry.register
 def sphere4(x: np.ndarray) -> float:
     """Even more translated sphere function."""
-    return sphere(x - 4.0)
+    return _shifted_sphere(x, 4.0)
+
+
+def _deceptive_terms(x: np.ndarray) -> np.ndarray:
+    """Computes 3 * x ** 2 - 2 / (3 ** (x - 2) ** 2 + 0.1) elementwise,
+    using in-place operations to limit the number of temporaries.
+    """
+    penalty = x - 2.0
+    np.square(penalty, out=penalty)
+    np.power(3.0, penalty, out=penalty)
+    penalty += 0.1
+    np.divide(2.0, penalty, out=penalty)
+    dec = np.multiply(x, x, dtype=float)
+    dec *= 3
+    dec -= penalty
+    return dec
 
 
 @registry.register
 def maxdeceptive(x: np.ndarray) -> float:
-    dec = 3 * x ** 2 - (2 / (3 ** (x - 2) ** 2 + 0.1))
-    return float(np.max(dec))
+    return float(np.max(_deceptive_terms(x)))
 
 
 @registry.register
 def sumdeceptive(x: np.ndarray) -> float:
-    dec = 3 * x ** 2 - (2 / (3 ** (x - 2) ** 2 + 0.1))
-    return float(np.sum(dec))
+    return float(np.sum(_deceptive_terms(x)))
 
 
 @registry.register
@@ -117,7 +150,8 @@ def altcigar(x: np.ndarray) -> float:
     """Similar to cigar, but variables in inverse order.
 
     E.g. for pointing out algorithms not invariant to the order of variables."""
-    return float(x[-1]) ** 2 + 1000000.0 * sphere(x[:-1])
+    y = x[:-1]
+    return float(x[-1]) ** 2 + 1000000.0 * float(y.dot(y))
 
 
 @registry.register
@@ -126,7 +160,8 @@ def cigar(x: np.ndarray) -> float:
 
     The other classical example is ellipsoid.
     """
-    return float(x[0]) ** 2 + 1000000.0 * sphere(x[1:])
+    y = x[1:]
+    return float(x[0]) ** 2 + 1000000.0 * float(y.dot(y))
 
 
 @registry.register
@@ -134,7 +169,30 @@ def altellipsoid(y: np.ndarray) -> float:
     """Similar to Ellipsoid, but variables in inverse order.
 
     E.g. for pointing out algorithms not invariant to the order of variables."""
-    return ellipsoid(y[::-1])
+    weights = _ellipsoid_weights(y.size, reverse=True, dtype=y.dtype)
+    return float(weights.dot(y * y))
+
+
+_ELLIPSOID_WEIGHTS: Dict[Tuple[int, bool, np.dtype], np.ndarray] = {}
+
+
+def _ellipsoid_weights(dim: int, reverse: bool = False, dtype: Any = np.float64) -> np.ndarray:
+    """Weights of the ellipsoid function, cached per dimension since the dimension
+    of a given function does not change throughout an optimization.
+    Reversed weights (for altellipsoid) are stored as a contiguous array as well.
+    Weights are provided in float32 for float32 inputs, and in float64 otherwise.
+    """
+    dtype = np.dtype(np.float32 if dtype == np.float32 else np.float64)
+    key = (dim, reverse, dtype)
+    weights = _ELLIPSOID_WEIGHTS.get(key)
+    if weights is None:
+        if reverse:
+            weights = _ellipsoid_weights(dim, dtype=dtype)[::-1].copy()
+        else:
+            weights = (10 ** np.linspace(0, 6, dim)).astype(dtype, copy=False)
+        weights.flags.writeable = False  # the cache is shared, make sure it cannot be modified
+        _ELLIPSOID_WEIGHTS[key] = weights
+    return weights
 
 
 @registry.register
@@ -143,47 +201,71 @@ def ellipsoid(x: np.ndarray) -> float:
 
     The other classical example is cigar.
     """
-    dim = x.size
-    weights = 10 ** np.linspace(0, 6, dim)
-    return float(weights.dot(x ** 2))
+    weights = _ellipsoid_weights(x.size, dtype=x.dtype)
+    return float(weights.dot(x * x))
 
 
 @registry.register
 def rastrigin(x: np.ndarray) -> float:
     """Classical multimodal function."""
-    cosi = float(np.sum(np.cos(2 * np.pi * x)))
-    return float(10 * (len(x) - cosi) + sphere(x))
+    cosines = _TWO_PI * x
+    np.cos(cosines, out=cosines)
+    cosi = float(np.sum(cosines))
+    return float(10 * (len(x) - cosi) + x.dot(x))
 
 
 @registry.register
 def hm(x: np.ndarray) -> float:
     """New multimodal function (proposed for Nevergrad)."""
-    return float((x ** 2).dot(1.1 + np.cos(1.0 / x)))
+    factors = 1.0 / x
+    np.cos(factors, out=factors)  # in-place operations avoid allocating several temporaries
+    factors += 1.1
+    factors *= x
+    return float(factors.dot(x))
 
 
 @registry.register
 def rosenbrock(x: np.ndarray) -> float:
     x_m_1 = x[:-1] - 1
-    x_diff = x[:-1] ** 2 - x[1:]
+    x_diff = np.square(x[:-1])
+    x_diff -= x[1:]  # in-place to avoid an additional temporary
     return float(100 * x_diff.dot(x_diff) + x_m_1.dot(x_m_1))
 
 
 def ackley(x: np.ndarray) -> float:
     dim = x.size
-    sum_cos = np.sum(np.cos(2 * np.pi * x))
-    return -20.0 * exp(-0.2 * sqrt(sphere(x) / dim)) - exp(sum_cos / dim) + 20 + exp(1)
+    cosines = _TWO_PI * x
+    np.cos(cosines, out=cosines)
+    sum_cos = float(np.sum(cosines))
+    return -20.0 * exp(-0.2 * sqrt(float(x.dot(x)) / dim)) - exp(sum_cos / dim) + 20 + exp(1)
 
 
 def schwefel_1_2(x: np.ndarray) -> float:
     cx = np.cumsum(x)
-    return sphere(cx)
+    return float(cx.dot(cx))
+
+
+_GRIEWANK_SCALES: Dict[int, np.ndarray] = {}
+
+
+def _griewank_scales(dim: int) -> np.ndarray:
+    """Inverse square roots 1 / sqrt(i + 1) used by the griewank function, cached per dimension.
+    """
+    scales = _GRIEWANK_SCALES.get(dim)
+    if scales is None:
+        scales = 1.0 / np.sqrt(1.0 + np.arange(dim))
+        scales.flags.writeable = False
+        _GRIEWANK_SCALES[dim] = scales
+    return scales
 
 
 @registry.register
 def griewank(x: np.ndarray) -> float:
     """Multimodal function, often used in Bayesian optimization."""
-    part1 = sphere(x)
-    part2 = np.prod(np.cos(x / np.sqrt(1 + np.arange(len(x)))))
+    part1 = x.dot(x)
+    cosines = x * _griewank_scales(len(x))
+    np.cos(cosines, out=cosines)
+    part2 = np.prod(cosines)
     return 1 + (float(part1) / 4000.0) - float(part2)
 
 
@@ -193,9 +275,10 @@ def deceptiveillcond(x: np.ndarray) -> float:
 
     The condition number increases to infinity as we get closer to the optimum."""
     assert len(x) >= 2
-    return float(
-        max(np.abs(np.arctan(x[1] / x[0])), np.sqrt(x[0] ** 2.0 + x[1] ** 2.0), 1.0 if x[0] > 0 else 0.0) if x[0] != 0.0 else float("inf")
-    )
+    x0, x1 = float(x[0]), float(x[1])  # math functions on Python floats are much faster than numpy on scalars
+    if x0 == 0.0:
+        return float("inf")
+    return max(abs(atan(x1 / x0)), sqrt(x0 * x0 + x1 * x1), 1.0 if x0 > 0 else 0.0)
 
 
 @registry.register
@@ -204,28 +287,30 @@ def deceptivepath(x: np.ndarray) -> float:
 
     The path becomes thiner as we get closer to the optimum."""
     assert len(x) >= 2
-    distance = np.sqrt(x[0] ** 2 + x[1] ** 2)
+    x0, x1 = float(x[0]), float(x[1])
+    distance = sqrt(x0 * x0 + x1 * x1)
     if distance == 0.0:
         return 0.0
-    angle = np.arctan(x[0] / x[1]) if x[1] != 0.0 else np.pi / 2.0
+    angle = atan(x0 / x1) if x1 != 0.0 else pi / 2.0
     invdistance = (1.0 / distance) if distance > 0.0 else 0.0
-    if np.abs(np.cos(invdistance) - angle) > 0.1:
+    if abs(cos(invdistance) - angle) > 0.1:
         return 1.0
-    return float(distance)
+    return distance
 
 
 @registry.register
 def deceptivemultimodal(x: np.ndarray) -> float:
     """Infinitely many local optima, as we get closer to the optimum."""
     assert len(x) >= 2
-    distance = np.sqrt(x[0] ** 2 + x[1] ** 2)
+    x0, x1 = float(x[0]), float(x[1])
+    distance = sqrt(x0 * x0 + x1 * x1)
     if distance == 0.0:
         return 0.0
-    angle = np.arctan(x[0] / x[1]) if x[1] != 0.0 else np.pi / 2.0
+    angle = atan(x0 / x1) if x1 != 0.0 else pi / 2.0
     invdistance = int(1.0 / distance) if distance > 0.0 else 0.0
-    if np.abs(np.cos(invdistance) - angle) > 0.1:
+    if abs(cos(invdistance) - angle) > 0.1:
         return 1.0
-    return float(distance)
+    return distance
 
 
 @registry.register
@@ -237,13 +322,13 @@ def lunacek(x: np.ndarray) -> float:
     s = 1.0 - (1.0 / (2.0 * np.sqrt(problemDimensions + 20.0) - 8.2))
     mu1 = 2.5
     mu2 = -np.sqrt(abs((mu1 ** 2 - 1.0) / s))
-    firstSum = 0.0
-    secondSum = 0.0
-    thirdSum = 0.0
-    for i in range(problemDimensions):
-        firstSum += (x[i] - mu1) ** 2
-        secondSum += (x[i] - mu2) ** 2
-        thirdSum += 1.0 - np.cos(2 * np.pi * (x[i] - mu1))
+    x_m_mu1 = x - mu1
+    x_m_mu2 = x - mu2
+    firstSum = float(x_m_mu1.dot(x_m_mu1))
+    secondSum = float(x_m_mu2.dot(x_m_mu2))
+    np.multiply(x_m_mu1, _TWO_PI, out=x_m_mu1)  # x_m_mu1 is not used anymore, reuse it as buffer
+    np.cos(x_m_mu1, out=x_m_mu1)
+    thirdSum = problemDimensions - float(np.sum(x_m_mu1))
     return min(firstSum, 1.0 * problemDimensions + secondSum) + 10 * thirdSum
 
 
@@ -365,7 +450,7 @@ def minusgenzgaussianpeakintegral(x: np.ndarray) -> float:
 
 @registry.register
 def slope(x: np.ndarray) -> float:
-    return sum(x)
+    return float(x.sum())
 
 
 @registry.register
@@ -8,6 +8,7 @@ from typing import List, Tuple, Any, Dict, Callable
 import numpy as np
 from . import utils
 from . import corefuncs
+from . import batchfuncs
 from .. import instrumentation as inst
 from ..common import tools
 from ..common.typetools import ArrayLike
@@ -172,9 +173,9 @@ class ArtificialFunction(inst.InstrumentedFunction, utils.PostponedObject, utils
         """Implements the call of the function.
         Under the hood, __call__ delegates to oracle_call + add some noise if noise_level > 0.
         """
-        results = []
-        for block in x:
-            results.append(self._func(block))
+        if len(x) == 1:  # single block: the scalar function is faster than the batch overhead
+            return float(self._func(x[0]))
+        results = batchfuncs.batch_call(self.name, x)  # all blocks are evaluated at once when possible
         return float(self._aggregator(results))
 
     def noisefree_function(self, *args: Any, **kwargs: Any) -> float:
@@ -0,0 +1,37 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from typing import Callable
+import numpy as np
+from ..common import testing
+from . import corefuncs
+from . import batchfuncs
+
+
+@testing.parametrized(**{name: (name, func) for name, func in batchfuncs.registry.items()})
+def test_batchfuncs_function(name: str, func: Callable[[np.ndarray], np.ndarray]) -> None:
+    assert name in corefuncs.registry, f"Batch function {name} has no core counterpart"
+    np.random.seed(12)
+    X = np.random.normal(0, 1, size=(7, 12))
+    output = func(X)
+    np.testing.assert_equal(output.shape, (7,))
+    expected = [corefuncs.registry[name](x) for x in X]
+    np.testing.assert_array_almost_equal(output, expected, decimal=7, err_msg=f"Wrong output for {name}")
+
+
+def test_genzcornerpeak_batch_inf() -> None:
+    X = np.array([[-np.inf, -np.inf], [0.0, 0.0]])
+    np.testing.assert_array_equal(batchfuncs.genzcornerpeak(X), [np.inf, 1.0])
+
+
+@testing.parametrized(
+    vectorized=("sphere",),
+    fallback=("deceptivepath",),
+)
+def test_batch_call(name: str) -> None:
+    np.random.seed(12)
+    X = np.random.normal(0, 1, size=(5, 3))
+    output = batchfuncs.batch_call(name, X)
+    np.testing.assert_array_almost_equal(output, [corefuncs.registry[name](x) for x in X])
@@ -19,7 +19,11 @@ def testcorefuncs_function(name: str, func: Callable[..., Any]) -> None:
     np.testing.assert_equal(outputs[0], outputs[1], f"Function {name} is not deterministic")
 
 
-@testing.parametrized(expe1=([6, 4, 2, 1, 9], 4, 5, 3), expe2=([6, 6, 7, 1, 9], 4, 5, 3))  # jump was assumed correct (verify?)
+@testing.parametrized(
+    expe1=([6, 4, 2, 1, 9], 4, 5, 3),  # jump was assumed correct (verify?)
+    expe2=([6, 6, 7, 1, 9], 4, 5, 3),
+    expe3=([1.2, 0.7, 1, 1], 0, 0, -1),
+)
 def test_base_functions(x: List[int], onemax_expected: float, leadingones_expected: float, jump_expected: float) -> None:
     np.testing.assert_equal(corefuncs._onemax(x), onemax_expected, err_msg="Wrong output for onemax")
     np.testing.assert_equal(corefuncs._leadingones(x), leadingones_expected, err_msg="Wrong output for leadingones")
@@ -54,6 +58,21 @@ def test_genzcornerpeak_inf() -> None:
     genzgaussianpeakintegral=(corefuncs.genzgaussianpeakintegral, 0.10427, None),
     minusgenzgaussianpeakintegral=(corefuncs.minusgenzgaussianpeakintegral, -0.10427, None),
     linear=(corefuncs.linear, 0.57969, None),
+    slope=(corefuncs.slope, 5.357, None),
+    maxdeceptive=(corefuncs.maxdeceptive, 8.670752, None),
+    maxdeceptive_m=(corefuncs.maxdeceptive, 47.975339, [1, 2, 3, 4]),
+    sumdeceptive=(corefuncs.sumdeceptive, 22.361331, None),
+    sumdeceptive_m=(corefuncs.sumdeceptive, 86.866835, [1, 2, 3, 4]),
+    deceptiveillcond=(corefuncs.deceptiveillcond, 1.0, None),
+    deceptiveillcond_m=(corefuncs.deceptiveillcond, 2.061553, [-0.5, -2.0]),
+    deceptiveillcond_inf=(corefuncs.deceptiveillcond, float("inf"), [0.0, 1.0]),
+    deceptivepath=(corefuncs.deceptivepath, 1.0, None),
+    deceptivepath_zero=(corefuncs.deceptivepath, 0.0, [0.0, 0.0]),
+    deceptivepath_on_path=(corefuncs.deceptivepath, 0.499653, [0.202, -0.457]),  # x[1] < 0: atan2 would differ
+    deceptivemultimodal=(corefuncs.deceptivemultimodal, 1.0, None),
+    deceptivemultimodal_on_path=(corefuncs.deceptivemultimodal, 0.300376, [0.251, -0.165]),
+    lunacek=(corefuncs.lunacek, 196.72108, None),
+    lunacek_m=(corefuncs.lunacek, 85, [1, 2, 3, 4]),
 )
 def test_core_function_values(func: Callable[[np.ndarray], float], expected: float, data: Optional[List[float]]) -> None:
     if data is None:
@@ -67,3 +86,23 @@ def test_styblinksitang() -> None:
     data = [0.662, -0.217, -0.968, 1.867, 0.101, 0.575, 0.199, 1.576, 1.006, 0.182, -0.092, 0.466]
     value = corefuncs._styblinksitang(np.array(data), noise=0.1)
     np.testing.assert_almost_equal(value, 421.374940, decimal=5)
+
+
+@testing.parametrized(**{name: (name,) for name in ["sphere", "ellipsoid", "altellipsoid", "rastrigin", "ackley", "rosenbrock"]})
+def test_float32_evaluation(name: str) -> None:
+    func = getattr(corefuncs, name)
+    x = np.array([0.662, -0.217, -0.968, 1.867, 0.101, 0.575, 0.199, 1.576, 1.006, 0.182, -0.092, 0.466])
+    expected = func(x)
+    value = func(x.astype(np.float32))
+    np.testing.assert_allclose(value, expected, rtol=1e-5)
+
+
+def test_ellipsoid_weights_dtype() -> None:
+    weights32 = corefuncs._ellipsoid_weights(12, dtype=np.float32)
+    weights64 = corefuncs._ellipsoid_weights(12, dtype=np.float64)
+    np.testing.assert_equal(weights32.dtype, np.float32)
+    np.testing.assert_equal(weights64.dtype, np.float64)
+    assert weights32 is not weights64
+    assert not np.shares_memory(weights32, weights64)
+    np.testing.assert_equal(corefuncs._ellipsoid_weights(12, reverse=True, dtype=np.float32).dtype, np.float32)
+    assert corefuncs._ellipsoid_weights(12, dtype=np.float32) is weights32  # cached
@@ -7,6 +7,7 @@ from typing import Any, Dict
 import numpy as np
 from ..common import testing
 from . import functionlib
+from . import corefuncs
 
 
 DESCRIPTION_KEYS = {"function_class", "name", "block_dimension", "useful_dimensions", "useless_variables", "translation_factor",
@@ -147,3 +148,18 @@ def test_noisy_call(x: int, noise: bool, noise_dissymmetry: bool, expect_noisy:
         np.testing.assert_raises(AssertionError, np.testing.assert_almost_equal, fx, x, decimal=8)
     else:
         np.testing.assert_almost_equal(fx, x, decimal=8)
+
+
+@testing.parametrized(
+    sphere=("sphere", "max"),
+    rastrigin=("rastrigin", "mean"),
+    rosenbrock=("rosenbrock", "sum"),
+    deceptivepath=("deceptivepath", "max"),  # no vectorized implementation
+)
+def test_function_from_transform_batch(name: str, aggregator: str) -> None:
+    func = functionlib.ArtificialFunction(name, block_dimension=4, num_blocks=3, aggregator=aggregator)
+    np.random.seed(12)
+    data = func._transform(np.random.normal(0, 1, func.dimension))
+    aggregate = getattr(np, aggregator)
+    expected = aggregate([corefuncs.registry[name](block) for block in data])
+    np.testing.assert_almost_equal(func.function_from_transform(data), expected, decimal=10)
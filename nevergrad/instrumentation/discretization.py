@@ -7,10 +7,11 @@ from typing import List, Union
 import warnings
 import numpy as np
 import scipy.stats
+import scipy.special
 from ..common.typetools import ArrayLike
 
 
-def threshold_discretization(x: ArrayLike, arity: int = 2) -> List[int]:
+def threshold_discretization(x: ArrayLike, arity: int = 2) -> np.ndarray:
     """Discretize by casting values from 0 to arity -1, assuming that x values
     follow a normal distribution.
 
@@ -21,6 +22,11 @@ def threshold_discretization(x: ArrayLike, arity: int = 2) -> List[int]:
     arity: int
        the number of possible integer values (arity n will lead to values from 0 to n - 1)
 
+    Returns
+    -------
+    np.ndarray
+        the array of integer values
+
     Note
     ----
     - nans are processed as negative infs (yields 0)
@@ -30,9 +36,10 @@ def threshold_discretization(x: ArrayLike, arity: int = 2) -> List[int]:
         warnings.warn("Encountered NaN values for discretization")
         x[np.isnan(x)] = -np.inf
     if arity == 2:  # special case, to have 0 yield 0
-        return (np.array(x) > 0).astype(int).tolist()  # type: ignore
+        return (x > 0).astype(int)
     else:
-        return np.clip(arity * scipy.stats.norm.cdf(x), 0, arity - 1).astype(int).tolist()  # type: ignore
+        # ndtr is the standard normal cdf ufunc, much faster than scipy.stats.norm.cdf
+        return np.clip(arity * scipy.special.ndtr(x), 0, arity - 1).astype(int)
 
 
 def inverse_threshold_discretization(indexes: List[int], arity: int = 2) -> ArrayLike:
@@ -105,7 +105,7 @@ class OrderedDiscrete(utils.Variable[X]):
 
     def data_to_argument(self, data: ArrayLike, random: Union[bool, np.random.RandomState] = True) -> X:  # pylint: disable=unused-argument
         assert len(data) == 1
-        index = discretization.threshold_discretization(data, arity=len(self.possibilities))[0]
+        index = int(discretization.threshold_discretization(data, arity=len(self.possibilities))[0])
         return self.possibilities[index]
 
     def argument_to_data(self, arg: X) -> ArrayLike: